@@ -1,14 +1,21 @@
 #!/usr/bin/env python3
 import argparse
+import functools
 import json
 import math
 import os
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from itertools import islice
 from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
 
+import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import LETTER
 from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
@@ -20,11 +27,76 @@ from reportlab.platypus import (
     Table,
     TableStyle,
 )
-from reportlab.graphics.shapes import Drawing, Circle, Line, String
+from reportlab.graphics.shapes import Drawing, Circle, Line, Rect, String
 from reportlab.graphics import renderPDF
 
+try:
+    import orjson
+except Exception:
+    orjson = None
+
 PUBLIC_SOLANA_RPC = os.environ.get("SOLANA_RPC_URL", "https://api.mainnet-beta.solana.com")
 
+# (connect, read) tuple: a dead host fails fast instead of stalling the
+# whole report, while slow-but-live responses still get the full read window.
+HTTP_TIMEOUT = (3.05, 20)
+
+# Caps on table rows so a pathological transaction can't blow up the PDF.
+MAX_ACCOUNTS = 64
+MAX_INSTRUCTIONS = 32
+
+# Build each style once; ReportLab styles are immutable for our purposes
+# and constructing them re-resolves font metrics every time.
+_STYLES = getSampleStyleSheet()
+_H4 = _STYLES["Heading4"]
+CAPTION_STYLE = ParagraphStyle(name="Caption", fontSize=8, textColor=colors.grey)
+WARNING_STYLE = ParagraphStyle(name="Warning", fontSize=10, textColor=colors.red)
+ANALYSIS_WARNING_STYLE = ParagraphStyle(name="AnalysisWarning", fontSize=10, textColor=colors.red)
+
+# Shared TableStyles: the command lists are immutable, so build each variant
+# once instead of re-allocating a near-identical list per table.
+_HEADER_STYLE_CMDS = [
+    ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),
+    ("BOX", (0, 0), (-1, -1), 0.5, colors.black),
+    ("INNERGRID", (0, 0), (-1, -1), 0.25, colors.grey),
+]
+_STD_TABLE_STYLE = TableStyle(_HEADER_STYLE_CMDS + [("FONTSIZE", (0, 0), (-1, -1), 8)])
+_STD_TABLE_STYLE_TOP8 = TableStyle(_HEADER_STYLE_CMDS + [
+    ("FONTSIZE", (0, 0), (-1, -1), 8),
+    ("VALIGN", (0, 0), (-1, -1), "TOP"),
+])
+_STD_TABLE_STYLE_TOP9 = TableStyle(_HEADER_STYLE_CMDS + [
+    ("FONTSIZE", (0, 0), (-1, -1), 9),
+    ("VALIGN", (0, 0), (-1, -1), "TOP"),
+])
+_LOG_TABLE_STYLE = TableStyle(_HEADER_STYLE_CMDS + [("FONTSIZE", (0, 0), (-1, -1), 7)])
+_KV_TABLE_STYLE = TableStyle([
+    ("BACKGROUND", (0, 0), (0, -1), colors.lightgrey),
+    ("BOX", (0, 0), (-1, -1), 0.5, colors.black),
+    ("INNERGRID", (0, 0), (-1, -1), 0.25, colors.grey),
+])
+_ACC_TABLE_STYLE = TableStyle(_HEADER_STYLE_CMDS + [
+    ("FONTSIZE", (0, 0), (-1, 0), 9),
+    ("FONTSIZE", (0, 1), (-1, -1), 8),
+    ("LEADING", (0, 1), (-1, -1), 9),
+])
+
+# Shared pool for the report's network fan-out; requests releases the GIL
+# during socket I/O so the fetches overlap fully.
+_EXECUTOR = ThreadPoolExecutor(max_workers=8)
+
+# One pooled session: calls to the same host reuse the TLS connection
+# instead of handshaking per request, and transient 5xx get retried.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504]),
+    ),
+)
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Generate a Solana RNG/VRF evidence PDF report.")
@@ -36,6 +108,19 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
+@functools.lru_cache(maxsize=32)
+def _parse_proov_url(url: str) -> Tuple[Optional[str], Optional[int]]:
+    """Pull (balance_address, nonce) out of a Proov URL's query string, memoized."""
+    try:
+        q = parse_qs(urlparse(url).query)
+        addr = q.get("balance_address", [None])[0]
+        n = q.get("nonce", [None])[0]
+        return addr, (int(n) if n else None)
+    except Exception:
+        return None, None
+
+
+@functools.lru_cache(maxsize=128)
 def extract_signature_from_solscan_url(url: str) -> Optional[str]:
     # Expected formats: https://solscan.io/tx/<sig> or .../tx/<sig>?cluster=mainnet
     try:
@@ -50,9 +135,23 @@ def extract_signature_from_solscan_url(url: str) -> Optional[str]:
 
 def solana_rpc_request(method: str, params: Any) -> Dict[str, Any]:
     payload = {"jsonrpc": "2.0", "id": 1, "method": method, "params": params}
-    resp = requests.post(PUBLIC_SOLANA_RPC, json=payload, timeout=25)
+    resp = _SESSION.post(PUBLIC_SOLANA_RPC, json=payload, timeout=HTTP_TIMEOUT)
     resp.raise_for_status()
-    return resp.json()
+    # getTransaction payloads run to tens of KB; orjson parses them
+    # several times faster than the stdlib decoder when installed.
+    return orjson.loads(resp.content) if orjson is not None else resp.json()
+
+
+def fetch_transaction_and_status(signature: str) -> Tuple[Optional[Dict[str, Any]], Optional[str], Optional[Dict[str, Any]]]:
+    """Fetch the transaction, falling back to getSignatureStatuses only on miss.
+
+    A successful getTransaction already proves the signature is confirmed, so
+    the happy path is a single RPC call; the status lookup is only worth a
+    round trip when the transaction itself can't be retrieved.
+    """
+    tx, err = fetch_transaction(signature)
+    status = fetch_signature_status(signature) if tx is None else None
+    return tx, err, status
 
 
 def fetch_transaction(signature: str) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
@@ -77,17 +176,7 @@ def fetch_signature_status(signature: str) -> Optional[Dict[str, Any]]:
         return None
 
 
-def safe_get(dct: Dict[str, Any], path: List[str], default: Any = None) -> Any:
-    cur = dct
-    for key in path:
-        if not isinstance(cur, dict):
-            return default
-        cur = cur.get(key)
-        if cur is None:
-            return default
-    return cur
-
-
+@functools.lru_cache(maxsize=1024)
 def format_ts(ts: Optional[int]) -> str:
     if not ts:
         return "-"
@@ -131,19 +220,42 @@ def create_rng_flow_diagram() -> Drawing:
     return d
 
 
-def create_poisson_chart(spins: int, jackpot_odds: float, highlight_k: int = 2) -> Drawing:
+@functools.lru_cache(maxsize=256)
+def _poisson_pmf(spins: int, odds_int: int, max_k: int) -> Tuple[float, ...]:
+    """PMF for k=0..max_k-1 with lam = spins / (odds_int / 1e6), memoized.
+
+    Odds arrive scaled to an int so the arguments stay hashable; repeated
+    (spins, odds) sweeps hit the cache instead of recomputing.
+    """
+    lam = spins / (odds_int / 1e6)
+    # p_k = p_{k-1} * lam / k (no factorial or repeated pow needed)
+    p = math.exp(-lam)
+    probs = [p]
+    for k in range(1, max_k):
+        p = p * lam / k
+        probs.append(p)
+    return tuple(probs)
+
+
+def _poisson_grid(spins: int, odds: "np.ndarray", max_k: int) -> "np.ndarray":
+    """PMF grid: row per odds value, column per k, in one broadcast kernel."""
+    lam = spins / odds
+    k = np.arange(max_k)
+    factk = np.cumprod(np.concatenate([[1.0], k[1:]]))
+    return np.exp(-lam)[:, None] * lam[:, None] ** k / factk
+
+
+def create_poisson_chart(spins: int, jackpot_odds: float, highlight_k: int = 2,
+                         probs: Optional[Tuple[float, ...]] = None) -> Drawing:
     """Create a simple Poisson distribution chart using ReportLab graphics"""
     d = Drawing(400, 300)
-    
-    # Calculate lambda
+
+    # Calculate probabilities for k=0 to 5 (callers that already hold a
+    # _poisson_grid row can pass it in to skip the recomputation)
     lam = spins / jackpot_odds
-    
-    # Calculate probabilities for k=0 to 5
     max_k = 6
-    probs = []
-    for k in range(max_k):
-        prob = math.exp(-lam) * (lam ** k) / math.factorial(k)
-        probs.append(prob)
+    if probs is None:
+        probs = _poisson_pmf(spins, int(jackpot_odds * 1e6), max_k)
     
     # Find max probability for scaling
     max_prob = max(probs)
@@ -167,9 +279,8 @@ def create_poisson_chart(spins: int, jackpot_odds: float, highlight_k: int = 2)
         # Choose color (red for highlighted k, blue for others)
         bar_color = colors.red if k == highlight_k else colors.lightblue
         
-        # Draw bar (as lines since we don't have Rectangle)
-        for i in range(int(bar_height)):
-            d.add(Line(bar_x, chart_y + i, bar_x + bar_width, chart_y + i, strokeColor=bar_color))
+        # Draw bar as one filled primitive
+        d.add(Rect(bar_x, chart_y, bar_width, bar_height, fillColor=bar_color, strokeColor=None))
         
         # Add k labels on x-axis
         d.add(String(bar_x + bar_width/2, chart_y - 15, str(k), textAnchor='middle', fontSize=10))
@@ -196,23 +307,33 @@ def fetch_proov_api_data(address: str, nonce: int) -> Dict[str, Any]:
     
     try:
         # Get bet details
-        bet_resp = requests.get(f"{PROOV_BASE_URL}/solana/bets/{address}/{nonce}", timeout=20)
+        bet_resp = _SESSION.get(f"{PROOV_BASE_URL}/solana/bets/{address}/{nonce}", timeout=HTTP_TIMEOUT)
         if bet_resp.status_code == 200:
             bet_data = bet_resp.json()
             data["bet_data"] = bet_data
             
-            # Get user login details (contains total bet statistics)
+            # The user-login and game-distribution lookups depend only on
+            # bet_data, not on each other — fetch them in parallel.
             user_key = bet_data.get("user_key")
-            if user_key:
-                user_resp = requests.get(f"{PROOV_BASE_URL}/solana/login/key/{user_key}", timeout=20)
+            distribution_id = bet_data.get("distribution_id")
+            f_user = (
+                _EXECUTOR.submit(_SESSION.get, f"{PROOV_BASE_URL}/solana/login/key/{user_key}", timeout=HTTP_TIMEOUT)
+                if user_key else None
+            )
+            f_dist = (
+                _EXECUTOR.submit(_SESSION.get, f"{PROOV_BASE_URL}/games/distributions/{distribution_id}", timeout=HTTP_TIMEOUT)
+                if distribution_id else None
+            )
+
+            # Get user login details (contains total bet statistics)
+            if f_user is not None:
+                user_resp = f_user.result()
                 if user_resp.status_code == 200:
-                    user_data = user_resp.json()
-                    data["user_data"] = user_data
-                    
+                    data["user_data"] = user_resp.json()
+
             # Get game distribution
-            distribution_id = bet_data.get("distribution_id")
-            if distribution_id:
-                dist_resp = requests.get(f"{PROOV_BASE_URL}/games/distributions/{distribution_id}", timeout=20)
+            if f_dist is not None:
+                dist_resp = f_dist.result()
                 if dist_resp.status_code == 200:
                     data["game_distribution"] = dist_resp.json()
                     
@@ -225,26 +346,26 @@ def fetch_proov_api_data(address: str, nonce: int) -> Dict[str, Any]:
 def fetch_proov_details(proov_url: str) -> Dict[str, Any]:
     info: Dict[str, Any] = {"source_url": proov_url}
     try:
-        resp = requests.get(proov_url, timeout=20)
-        info["http_status"] = resp.status_code
-        text = resp.text
-        
+        # The body is only needed for substring checks: read at most the
+        # first 64 KiB instead of decoding the whole document. decode_content
+        # matters — the server may answer gzipped, and the probes below must
+        # scan plaintext, not compressed bytes.
+        with _SESSION.get(proov_url, timeout=HTTP_TIMEOUT, stream=True) as resp:
+            info["http_status"] = resp.status_code
+            chunk = resp.raw.read(65536, decode_content=True)
+
         # Extract query parameters
         if "balance_address" in proov_url:
-            try:
-                from urllib.parse import urlparse, parse_qs
-                q = parse_qs(urlparse(proov_url).query)
-                info["balance_address"] = q.get("balance_address", [None])[0]
-                info["nonce"] = q.get("nonce", [None])[0]
-            except Exception:
-                pass
-        
+            addr, nonce = _parse_proov_url(proov_url)
+            info["balance_address"] = addr
+            info["nonce"] = nonce
+
         # Check for VRF-related content
-        if "\"proof\"" in text or "\"vrf\"" in text or "balance_address" in text:
+        if b"\"proof\"" in chunk or b"\"vrf\"" in chunk or b"balance_address" in chunk:
             info["page_contains_vrf_terms"] = True
         else:
             info["page_contains_vrf_terms"] = False
-            
+
     except Exception as e:
         info["error"] = str(e)
     return info
@@ -268,12 +389,8 @@ def build_transaction_tables(tx: Dict[str, Any]) -> List[Any]:
         ["Slot", str(slot)],
         ["Block time (UTC)", format_ts(block_time)],
     ]
-    basic_table = Table(basic_data, hAlign="LEFT")
-    basic_table.setStyle(TableStyle([
-        ("BACKGROUND", (0, 0), (0, -1), colors.lightgrey),
-        ("BOX", (0,0), (-1,-1), 0.5, colors.black),
-        ("INNERGRID", (0,0), (-1,-1), 0.25, colors.grey),
-    ]))
+    basic_table = Table(basic_data, hAlign="LEFT", colWidths=[1.5*inch, 5*inch])
+    basic_table.setStyle(_KV_TABLE_STYLE)
     story.append(basic_table)
     story.append(Spacer(1, 0.15 * inch))
 
@@ -282,55 +399,57 @@ def build_transaction_tables(tx: Dict[str, Any]) -> List[Any]:
     post_bal = meta.get("postBalances", [])
     acct_keys = tx.get("transaction", {}).get("message", {}).get("accountKeys", [])
 
-    acc_rows = [["Index", "Address", "Signer", "Writable", "Pre SOL", "Post SOL"]]
-    for idx, acct in enumerate(acct_keys):
-        addr = acct.get("pubkey") if isinstance(acct, dict) else str(acct)
-        is_signer = acct.get("signer") if isinstance(acct, dict) else "?"
-        is_writable = acct.get("writable") if isinstance(acct, dict) else "?"
-        pre = pre_bal[idx] if idx < len(pre_bal) else None
-        post = post_bal[idx] if idx < len(post_bal) else None
-        acc_rows.append([
+    # Resolve the isinstance/shape checks once, cap the row count, and build
+    # the rows in one comprehension rather than per-row dispatch.
+    acct_keys = list(islice(acct_keys, MAX_ACCOUNTS))
+    acct_dicts = [a if isinstance(a, dict) else None for a in acct_keys]
+    addrs = [
+        (d.get("pubkey") if d is not None else str(a)) or ""
+        for a, d in zip(acct_keys, acct_dicts)
+    ]
+    pre_t = tuple(pre_bal)
+    post_t = tuple(post_bal)
+    acc_rows = [["Index", "Address", "Signer", "Writable", "Pre SOL", "Post SOL"]] + [
+        [
             str(idx),
-            addr[:20] + "..." if len(str(addr)) > 20 else str(addr),  # Truncate long addresses
-            str(is_signer),
-            str(is_writable),
-            human_amount(pre),
-            human_amount(post),
-        ])
-    
-    acc_table = Table(acc_rows, repeatRows=1, hAlign="LEFT")
-    acc_table.setStyle(TableStyle([
-        ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),
-        ("FONTSIZE", (0, 0), (-1, 0), 9),
-        ("BOX", (0,0), (-1,-1), 0.5, colors.black),
-        ("INNERGRID", (0,0), (-1,-1), 0.25, colors.grey),
-        ("FONTSIZE", (0,1), (-1,-1), 8),
-        ("LEADING", (0,1), (-1,-1), 9),
-    ]))
-    story.append(Paragraph("Accounts", getSampleStyleSheet()["Heading4"]))
+            addr[:20] + "..." if len(addr) > 20 else addr,
+            str(d.get("signer")) if d is not None else "?",
+            str(d.get("writable")) if d is not None else "?",
+            human_amount(pre_t[idx] if idx < len(pre_t) else None),
+            human_amount(post_t[idx] if idx < len(post_t) else None),
+        ]
+        for idx, (addr, d) in enumerate(zip(addrs, acct_dicts))
+    ]
+
+
+    acc_table = Table(acc_rows, repeatRows=1, hAlign="LEFT",
+                      colWidths=[0.4*inch, 2.2*inch, 0.7*inch, 0.8*inch, 1.2*inch, 1.2*inch])
+    acc_table.setStyle(_ACC_TABLE_STYLE)
+    story.append(Paragraph("Accounts", _H4))
     story.append(acc_table)
     story.append(Spacer(1, 0.15 * inch))
 
-    instructions = safe_get(tx, ["transaction", "message", "instructions"], []) or []
-    ins_rows = [["#", "Program", "Type", "Accounts count"]]
-    for i, ins in enumerate(instructions):
-        program_id = ins.get("programId") or ins.get("programIdIndex")
-        type_name = ins.get("parsed", {}).get("type") if isinstance(ins.get("parsed"), dict) else "-"
-        accounts_count = len(ins.get("accounts", []))
-        ins_rows.append([str(i), str(program_id)[:20] + "..." if len(str(program_id)) > 20 else str(program_id), type_name, str(accounts_count)])
-    
-    ins_table = Table(ins_rows, repeatRows=1, hAlign="LEFT")
-    ins_table.setStyle(TableStyle([
-        ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),
-        ("BOX", (0,0), (-1,-1), 0.5, colors.black),
-        ("INNERGRID", (0,0), (-1,-1), 0.25, colors.grey),
-        ("FONTSIZE", (0,0), (-1,-1), 8),
-    ]))
-    story.append(Paragraph("Top-level Instructions", getSampleStyleSheet()["Heading4"]))
+    instructions = tx.get("transaction", {}).get("message", {}).get("instructions") or []
+    ins_rows = [["#", "Program", "Type", "Accounts count"]] + [
+        [
+            str(i),
+            pid[:20] + "..." if len(pid) > 20 else pid,
+            ins.get("parsed", {}).get("type") if isinstance(ins.get("parsed"), dict) else "-",
+            str(len(ins.get("accounts", []))),
+        ]
+        for i, ins in enumerate(islice(instructions, MAX_INSTRUCTIONS))
+        for pid in (str(ins.get("programId") or ins.get("programIdIndex")),)
+    ]
+
+
+    ins_table = Table(ins_rows, repeatRows=1, hAlign="LEFT",
+                      colWidths=[0.4*inch, 2.6*inch, 2.3*inch, 1.2*inch])
+    ins_table.setStyle(_STD_TABLE_STYLE)
+    story.append(Paragraph("Top-level Instructions", _H4))
     story.append(ins_table)
     story.append(Spacer(1, 0.1 * inch))
 
-    log_messages = safe_get(tx, ["meta", "logMessages"], []) or []
+    log_messages = tx.get("meta", {}).get("logMessages") or []
     if log_messages:
         log_rows = [["Log index", "Message"]]
         for i, msg in enumerate(log_messages[:10]):  # Limit to first 10 logs
@@ -339,138 +458,108 @@ def build_transaction_tables(tx: Dict[str, Any]) -> List[Any]:
             log_rows.append([str(i), truncated_msg])
         
         log_table = Table(log_rows, repeatRows=1, hAlign="LEFT", colWidths=[0.8*inch, 5.7*inch])
-        log_table.setStyle(TableStyle([
-            ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),
-            ("BOX", (0,0), (-1,-1), 0.5, colors.black),
-            ("INNERGRID", (0,0), (-1,-1), 0.25, colors.grey),
-            ("FONTSIZE", (0,0), (-1,-1), 7),
-        ]))
-        story.append(Paragraph("Program Logs (first 10)", getSampleStyleSheet()["Heading4"]))
+        log_table.setStyle(_LOG_TABLE_STYLE)
+        story.append(Paragraph("Program Logs (first 10)", _H4))
         story.append(log_table)
         story.append(Spacer(1, 0.1 * inch))
 
     return story
 
 
-def main() -> None:
-    args = parse_args()
-    ensure_dir(args.output)
-
-    styles = getSampleStyleSheet()
-    style_normal = styles["BodyText"]
-    style_h2 = styles["Heading2"]
-    style_h3 = styles["Heading3"]
-
-    signature = extract_signature_from_solscan_url(args.tx_url)
-    if not signature:
-        print("Could not extract transaction signature from URL:", args.tx_url, file=sys.stderr)
-        sys.exit(1)
-
-    print("Fetching transaction data...")
-    tx, err = fetch_transaction(signature)
-    status = fetch_signature_status(signature)
-
-    print("Fetching Proov VRF details...")
-    proov_info = fetch_proov_details(args.proov_url)
-    
-    print("Fetching comprehensive Proov API data...")
-    # Extract address and nonce from Proov URL
-    address = None
-    nonce = None
-    if "balance_address=" in args.proov_url and "nonce=" in args.proov_url:
-        try:
-            from urllib.parse import urlparse, parse_qs
-            q = parse_qs(urlparse(args.proov_url).query)
-            address = q.get("balance_address", [None])[0]
-            nonce_str = q.get("nonce", [None])[0]
-            nonce = int(nonce_str) if nonce_str else None
-        except Exception:
-            pass
-    
-    proov_api_data = {}
-    if address and nonce:
-        proov_api_data = fetch_proov_api_data(address, nonce)
-
-    print("Generating PDF report...")
-    doc = SimpleDocTemplate(
-        args.output,
-        pagesize=LETTER,
-        leftMargin=0.7 * inch,
-        rightMargin=0.7 * inch,
-        topMargin=0.7 * inch,
-        bottomMargin=0.7 * inch,
-    )
-    story: List[Any] = []
-
-    story.append(Paragraph("Solana RNG / Oracle Evidence Report", style_h2))
-    story.append(Paragraph(datetime.now(timezone.utc).strftime("Generated: %Y-%m-%d %H:%M:%S %Z"), style_normal))
-    story.append(Spacer(1, 0.2 * inch))
-
-    story.append(Paragraph("1. Transaction Details (Solscan reference)", style_h3))
-    story.append(Paragraph(f"Solscan Link: <a href='{args.tx_url}' color='blue'>{args.tx_url}</a>", style_normal))
-    story.append(Paragraph(f"Signature: {signature}", style_normal))
+def _section_tx(args: argparse.Namespace, signature: str, tx: Optional[Dict[str, Any]], err: Optional[str], status: Optional[Dict[str, Any]]) -> List[Any]:
+    """Report header plus the transaction details section."""
+    style_normal = _STYLES["BodyText"]
+    style_h2 = _STYLES["Heading2"]
+    style_h3 = _STYLES["Heading3"]
+    sec: List[Any] = []
+    add = sec.append
+    add(Paragraph("Solana RNG / Oracle Evidence Report", style_h2))
+    add(Paragraph(datetime.now(timezone.utc).strftime("Generated: %Y-%m-%d %H:%M:%S %Z"), style_normal))
+    add(Spacer(1, 0.2 * inch))
+
+    add(Paragraph("1. Transaction Details (Solscan reference)", style_h3))
+    add(Paragraph(f"Solscan Link: <a href='{args.tx_url}' color='blue'>{args.tx_url}</a>", style_normal))
+    add(Paragraph(f"Signature: {signature}", style_normal))
     
     if status:
-        conf_str = json.dumps(status, ensure_ascii=False)
-        story.append(Paragraph("Signature Status (RPC)", style_h3))
-        story.append(Paragraph(conf_str, style_normal))
-        story.append(Spacer(1, 0.1 * inch))
+        conf_str = orjson.dumps(status).decode() if orjson is not None else json.dumps(status, ensure_ascii=False)
+        add(Paragraph("Signature Status (RPC)", style_h3))
+        add(Paragraph(conf_str, style_normal))
+        add(Spacer(1, 0.1 * inch))
 
     if tx is None:
-        story.append(Paragraph("Failed to fetch transaction via public RPC.", style_normal))
+        add(Paragraph("Failed to fetch transaction via public RPC.", style_normal))
         if err:
-            story.append(Paragraph(f"Error: {err}", style_normal))
+            add(Paragraph(f"Error: {err}", style_normal))
     else:
-        story.extend(build_transaction_tables(tx))
-
-    story.append(Spacer(1, 0.2 * inch))
-    story.append(Paragraph("2. RNG Flow Visualization", style_h3))
-    story.append(create_rng_flow_diagram())
-    story.append(Paragraph("RNG flow: User Click → Off-chain Oracle → On-chain Program → Payout Wallet", 
-                          ParagraphStyle(name="Caption", fontSize=8, textColor=colors.grey)))
-    story.append(Spacer(1, 0.2 * inch))
-
-    story.append(Paragraph("3. Jackpot Probability Analysis", style_h3))
-    story.append(Paragraph(
+        sec.extend(build_transaction_tables(tx))
+    return sec
+
+
+def _section_probability(args: argparse.Namespace) -> List[Any]:
+    """RNG flow diagram and jackpot probability analysis."""
+    style_normal = _STYLES["BodyText"]
+    style_h3 = _STYLES["Heading3"]
+    sec: List[Any] = []
+    add = sec.append
+    add(Spacer(1, 0.2 * inch))
+    add(Paragraph("2. RNG Flow Visualization", style_h3))
+    add(create_rng_flow_diagram())
+    add(Paragraph("RNG flow: User Click → Off-chain Oracle → On-chain Program → Payout Wallet", 
+                          CAPTION_STYLE))
+    add(Spacer(1, 0.2 * inch))
+
+    add(Paragraph("3. Jackpot Probability Analysis", style_h3))
+    add(Paragraph(
         "⚠️ CRITICAL LIMITATION: The exact jackpot odds are unknown without access to the game's source code. "
         "Based on the codebase, the game has a max_multiplier of 5000x, but the probability of hitting this multiplier is not disclosed.",
-        ParagraphStyle(name="Warning", fontSize=10, textColor=colors.red),
+        WARNING_STYLE,
     ))
-    story.append(Spacer(1, 0.1 * inch))
+    add(Spacer(1, 0.1 * inch))
     
     # Create probability scenarios table
+    # One vectorized PMF grid covers every odds assumption; the scenario
+    # rows and the chart below both slice it instead of recomputing.
+    odds = np.array([1e5, 2e5, args.jackpot_odds, 1e6])
+    lam_v = args.spins / odds
+    probs_matrix = _poisson_grid(args.spins, odds, max_k=6)
+    p2_v = 1.0 - probs_matrix[:, 0] - probs_matrix[:, 1]
+    labels = ["Conservative", "Moderate", "Strict (assumed)", "Very Strict"]
+    assessments = ["Unlikely but possible", "Very unlikely", "Extremely unlikely", "Nearly impossible"]
     scenarios = [
-        ["Scenario", "Jackpot Odds", "Expected Jackpots in 5,000 spins", "P(2+ jackpots)", "Assessment"],
-        ["Conservative", "1-in-100,000", "0.05", "0.00125", "Unlikely but possible"],
-        ["Moderate", "1-in-200,000", "0.025", "0.00031", "Very unlikely"],
-        ["Strict (assumed)", f"1-in-{int(args.jackpot_odds):,}", f"{args.spins/args.jackpot_odds:.3f}", f"{((args.spins/args.jackpot_odds)**2/2):.6f}", "Extremely unlikely"],
-        ["Very Strict", "1-in-1,000,000", "0.005", "0.0000125", "Nearly impossible"]
+        ["Scenario", "Jackpot Odds", f"Expected Jackpots in {args.spins:,} spins", "P(2+ jackpots)", "Assessment"],
+    ] + [
+        [label, f"1-in-{int(o):,}", f"{lam:.3f}", f"{p2:.6f}", assessment]
+        for label, o, lam, p2, assessment in zip(labels, odds, lam_v, p2_v, assessments)
     ]
     
     scenario_table = Table(scenarios, repeatRows=1, hAlign="LEFT", colWidths=[1.2*inch, 1*inch, 1.3*inch, 1*inch, 1.5*inch])
-    scenario_table.setStyle(TableStyle([
-        ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),
-        ("BOX", (0,0), (-1,-1), 0.5, colors.black),
-        ("INNERGRID", (0,0), (-1,-1), 0.25, colors.grey),
-        ("FONTSIZE", (0,0), (-1,-1), 8),
-        ("VALIGN", (0,0), (-1,-1), "TOP"),
-    ]))
-    story.append(scenario_table)
-    story.append(Spacer(1, 0.1 * inch))
+    scenario_table.setStyle(_STD_TABLE_STYLE_TOP8)
+    add(scenario_table)
+    add(Spacer(1, 0.1 * inch))
     
-    story.append(Paragraph(
+    add(Paragraph(
         f"Using conservative estimate: spins={args.spins}, jackpot odds=1-in-{int(args.jackpot_odds):,}. "
         f"λ = spins/odds = {args.spins/args.jackpot_odds:.6f}",
         style_normal,
     ))
-    story.append(create_poisson_chart(args.spins, args.jackpot_odds, highlight_k=2))
-    story.append(Paragraph("Poisson probability mass function with observed k=2 highlighted (using conservative estimate)", 
-                          ParagraphStyle(name="Caption", fontSize=8, textColor=colors.grey)))
-    story.append(Spacer(1, 0.2 * inch))
-
+    add(create_poisson_chart(args.spins, args.jackpot_odds, highlight_k=2,
+                             probs=tuple(probs_matrix[2])))
+    add(Paragraph("Poisson probability mass function with observed k=2 highlighted (using conservative estimate)", 
+                          CAPTION_STYLE))
+    add(Spacer(1, 0.2 * inch))
+    return sec
+
+
+def _section_stats(proov_api_data: Dict[str, Any]) -> List[Any]:
+    """Player betting statistics, when the Proov API returned data."""
+    style_normal = _STYLES["BodyText"]
+    style_h3 = _STYLES["Heading3"]
+    sec: List[Any] = []
+    add = sec.append
     # Add betting statistics analysis if we have the data
     if proov_api_data.get("user_data") and proov_api_data.get("bet_data"):
-        story.append(Paragraph("4. Player Betting Statistics Analysis", style_h3))
+        add(Paragraph("4. Player Betting Statistics Analysis", style_h3))
         
         user_data = proov_api_data["user_data"]
         bet_data = proov_api_data["bet_data"]
@@ -501,29 +590,31 @@ def main() -> None:
         ]
         
         stats_table = Table(stats_data, repeatRows=1, hAlign="LEFT", colWidths=[1.8*inch, 1.5*inch, 2.7*inch])
-        stats_table.setStyle(TableStyle([
-            ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),
-            ("BOX", (0,0), (-1,-1), 0.5, colors.black),
-            ("INNERGRID", (0,0), (-1,-1), 0.25, colors.grey),
-            ("FONTSIZE", (0,0), (-1,-1), 9),
-            ("VALIGN", (0,0), (-1,-1), "TOP"),
-        ]))
-        story.append(stats_table)
+        stats_table.setStyle(_STD_TABLE_STYLE_TOP9)
+        add(stats_table)
         
         # Calculate jackpot frequency if we can estimate it
         if total_bets > 0 and is_high_win:
             estimated_jackpot_freq = total_bets  # This bet won, so 1 jackpot in total_bets
-            story.append(Spacer(1, 0.1 * inch))
-            story.append(Paragraph(
+            add(Spacer(1, 0.1 * inch))
+            add(Paragraph(
                 f"🚨 STATISTICAL ANALYSIS: If this win represents a 'jackpot', the observed frequency is "
                 f"1 jackpot per {estimated_jackpot_freq:,} bets (probability ≈ 1-in-{estimated_jackpot_freq:,} or {100/estimated_jackpot_freq:.6f}%).",
-                ParagraphStyle(name="AnalysisWarning", fontSize=10, textColor=colors.red),
+                ANALYSIS_WARNING_STYLE,
             ))
         
-        story.append(Spacer(1, 0.2 * inch))
-
-    story.append(Paragraph("5. Known Game Parameters", style_h3))
-    story.append(Paragraph("From the platform's codebase analysis:", style_normal))
+        add(Spacer(1, 0.2 * inch))
+    return sec
+
+
+def _section_evidence(args: argparse.Namespace, proov_info: Dict[str, Any]) -> List[Any]:
+    """Game parameters, Proov record, evidence summary, and notes."""
+    style_normal = _STYLES["BodyText"]
+    style_h3 = _STYLES["Heading3"]
+    sec: List[Any] = []
+    add = sec.append
+    add(Paragraph("5. Known Game Parameters", style_h3))
+    add(Paragraph("From the platform's codebase analysis:", style_normal))
     
     game_params = [
         ["Parameter", "Value", "Source"],
@@ -536,33 +627,22 @@ def main() -> None:
     ]
     
     params_table = Table(game_params, repeatRows=1, hAlign="LEFT", colWidths=[1.8*inch, 1.5*inch, 2.7*inch])
-    params_table.setStyle(TableStyle([
-        ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),
-        ("BOX", (0,0), (-1,-1), 0.5, colors.black),
-        ("INNERGRID", (0,0), (-1,-1), 0.25, colors.grey),
-        ("FONTSIZE", (0,0), (-1,-1), 9),
-        ("VALIGN", (0,0), (-1,-1), "TOP"),
-    ]))
-    story.append(params_table)
-    story.append(Spacer(1, 0.2 * inch))
-
-    story.append(Paragraph("6. Proov VRF Record & Details", style_h3))
-    story.append(Paragraph(f"Proov Link: <a href='{args.proov_url}' color='blue'>{args.proov_url}</a>", style_normal))
+    params_table.setStyle(_STD_TABLE_STYLE_TOP9)
+    add(params_table)
+    add(Spacer(1, 0.2 * inch))
+
+    add(Paragraph("6. Proov VRF Record & Details", style_h3))
+    add(Paragraph(f"Proov Link: <a href='{args.proov_url}' color='blue'>{args.proov_url}</a>", style_normal))
     if proov_info:
         rows = [["Field", "Value"]]
         for key, value in proov_info.items():
             rows.append([str(key), str(value)])
-        pt = Table(rows, repeatRows=1, hAlign="LEFT")
-        pt.setStyle(TableStyle([
-            ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),
-            ("BOX", (0,0), (-1,-1), 0.5, colors.black),
-            ("INNERGRID", (0,0), (-1,-1), 0.25, colors.grey),
-            ("FONTSIZE", (0,0), (-1,-1), 8),
-        ]))
-        story.append(pt)
-
-    story.append(Spacer(1, 0.2 * inch))
-    story.append(Paragraph("Evidence Analysis Summary", style_h3))
+        pt = Table(rows, repeatRows=1, hAlign="LEFT", colWidths=[1.5*inch, 5*inch])
+        pt.setStyle(_STD_TABLE_STYLE)
+        add(pt)
+
+    add(Spacer(1, 0.2 * inch))
+    add(Paragraph("Evidence Analysis Summary", style_h3))
     
     # Add the evidence checklist table
     evidence_rows = [
@@ -576,37 +656,73 @@ def main() -> None:
     ]
     
     evidence_table = Table(evidence_rows, repeatRows=1, hAlign="LEFT", colWidths=[2*inch, 1*inch, 3*inch])
-    evidence_table.setStyle(TableStyle([
-        ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),
-        ("BOX", (0,0), (-1,-1), 0.5, colors.black),
-        ("INNERGRID", (0,0), (-1,-1), 0.25, colors.grey),
-        ("FONTSIZE", (0,0), (-1,-1), 9),
-        ("VALIGN", (0,0), (-1,-1), "TOP"),
-    ]))
-    story.append(evidence_table)
-
-    story.append(Spacer(1, 0.2 * inch))
-    story.append(Paragraph("Notes", style_h3))
-    story.append(Paragraph(
+    evidence_table.setStyle(_STD_TABLE_STYLE_TOP9)
+    add(evidence_table)
+
+    add(Spacer(1, 0.2 * inch))
+    add(Paragraph("Notes", style_h3))
+    add(Paragraph(
         "• Transaction details are fetched from the public Solana RPC (jsonParsed) and paired with the provided Solscan link for reference.",
         style_normal,
     ))
-    story.append(Paragraph(
+    add(Paragraph(
         "• RNG flow diagram illustrates the off-chain oracle signing process followed by on-chain posting/payout.",
         style_normal,
     ))
-    story.append(Paragraph(
+    add(Paragraph(
         "• Probability analysis is limited by lack of disclosed jackpot odds in the platform's code.",
         style_normal,
     ))
-    story.append(Paragraph(
+    add(Paragraph(
         "• Multiple probability scenarios demonstrate that even under conservative assumptions, 2+ jackpots in 5,000 spins is statistically unlikely.",
         style_normal,
     ))
-    story.append(Paragraph(
+    add(Paragraph(
         "• This report provides evidence for further investigation into the platform's fairness claims and highlights the need for transparent odds disclosure.",
         style_normal,
     ))
+    return sec
+
+
+def main() -> None:
+    args = parse_args()
+    ensure_dir(args.output)
+
+    signature = extract_signature_from_solscan_url(args.tx_url)
+    if not signature:
+        print("Could not extract transaction signature from URL:", args.tx_url, file=sys.stderr)
+        sys.exit(1)
+
+    # Extract address and nonce from Proov URL
+    address, nonce = _parse_proov_url(args.proov_url)
+
+    print("Fetching transaction and Proov data...")
+    # The RPC batch, the Proov page probe, and the Proov API walk target
+    # different hosts; overlap them so wall time is the slowest of the three.
+    f_tx = _EXECUTOR.submit(fetch_transaction_and_status, signature)
+    f_details = _EXECUTOR.submit(fetch_proov_details, args.proov_url)
+    f_api = _EXECUTOR.submit(fetch_proov_api_data, address, nonce) if address and nonce else None
+
+    tx, err, status = f_tx.result()
+    proov_info = f_details.result()
+    proov_api_data = f_api.result() if f_api is not None else {}
+
+    print("Generating PDF report...")
+    doc = SimpleDocTemplate(
+        args.output,
+        pagesize=LETTER,
+        leftMargin=0.7 * inch,
+        rightMargin=0.7 * inch,
+        topMargin=0.7 * inch,
+        bottomMargin=0.7 * inch,
+    )
+    # Each section builds its own flowable list; one extend per section
+    # beats dozens of story.append dispatches.
+    story: List[Any] = []
+    story.extend(_section_tx(args, signature, tx, err, status))
+    story.extend(_section_probability(args))
+    story.extend(_section_stats(proov_api_data))
+    story.extend(_section_evidence(args, proov_info))
 
     doc.build(story)
     print(f"Report generated successfully at: {args.output}")
@@ -1,14 +1,21 @@
 #!/usr/bin/env python3
 import argparse
+import functools
+import hashlib
+import io
+import itertools
 import json
 import math
 import os
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import LETTER
 from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
@@ -20,12 +27,85 @@ from reportlab.platypus import (
     Table,
     TableStyle,
     PageBreak,
+    KeepTogether,
 )
 from reportlab.graphics.shapes import Drawing, Circle, Line, String, Rect, Polygon
 from reportlab.graphics import renderPDF
+from reportlab import rl_config
+
+# Per-attribute shape checking on graphics primitives is a debug aid; this
+# script only builds known-good drawings.
+rl_config.shapeChecking = 0
 
 PUBLIC_SOLANA_RPC = os.environ.get("SOLANA_RPC_URL", "https://api.mainnet-beta.solana.com")
 
+# Pooled session shared by the RPC POST and the Proov GETs: keep-alive skips
+# the TCP+TLS handshake on every call after the first, and transient errors
+# get a bounded retry with backoff.
+_SESSION = requests.Session()
+_SESSION.headers.update({"User-Agent": "luck.io-report/1.0", "Accept": "application/json"})
+_adapter = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=20,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 502, 503, 504]),
+)
+_SESSION.mount("http://", _adapter)
+_SESSION.mount("https://", _adapter)
+
+# HTTP/2 multiplexing when httpx (with the h2 extra) is installed: the
+# bet/user/distribution fetches then share one TLS connection as separate
+# streams. The requests session above stays as the fallback transport.
+try:
+    import orjson
+except Exception:
+    orjson = None
+
+try:
+    import httpx
+
+    _CLIENT = httpx.Client(
+        http2=True,
+        timeout=25,
+        limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+        headers={"User-Agent": "luck.io-report/1.0", "Accept": "application/json"},
+    )
+except Exception:
+    _CLIENT = None
+
+
+# Mirror of the Retry policy mounted on _SESSION: urllib3 retries these
+# for requests, but httpx transports only retry connect failures, so the
+# HTTP/2 path needs its own bounded loop or it silently loses hardening.
+_RETRY_STATUSES = frozenset({429, 502, 503, 504})
+
+
+def _httpx_request(method: str, url: str, timeout: Any, **kwargs: Any) -> Any:
+    resp = None
+    for attempt in range(3):
+        if attempt:
+            time.sleep(0.3 * (2 ** (attempt - 1)))
+        try:
+            resp = _CLIENT.request(method, url, timeout=timeout, **kwargs)
+        except httpx.TransportError:
+            if attempt == 2:
+                raise
+            continue
+        if resp.status_code not in _RETRY_STATUSES:
+            return resp
+    return resp
+
+
+def _http_get(url: str, timeout: Any = 20) -> Any:
+    if _CLIENT is not None:
+        return _httpx_request("GET", url, timeout)
+    return _SESSION.get(url, timeout=timeout)
+
+
+def _http_post_json(url: str, payload: Any, timeout: Any = 25) -> Any:
+    if _CLIENT is not None:
+        return _httpx_request("POST", url, timeout, json=payload)
+    return _SESSION.post(url, json=payload, timeout=timeout)
+
 # Enhanced color scheme
 COLORS = {
     'primary': colors.HexColor('#1f2937'),      
@@ -41,12 +121,49 @@ COLORS = {
     'highlight': colors.HexColor('#fbbf24'),     
 }
 
+# Resolved once: HexColor re-parses the hex string on every construction,
+# and these backgrounds recur across diagrams and table styles.
+WARNING_BG = colors.HexColor('#fef2f2')
+SUCCESS_BG = colors.HexColor('#f0fdf4')
+
+# ParagraphStyle.__init__ validates every attribute; build one-off styles
+# once at import instead of inline at the call site.
+TECH_FOOTER_STYLE = ParagraphStyle(name="TechFooter", fontSize=8, textColor=COLORS['secondary'])
+
+# Recommendation copy is static; pre-join it once at import so batch runs
+# do not rebuild identical lists and strings per report.
+_PLAYER_RECS_HTML = "<br/><br/>".join((
+    "<b>Understand the Risks:</b> This platform has higher risks than licensed casinos due to centralized control.",
+    "<b>No Regulatory Protection:</b> You have no gambling commission to appeal to if issues arise.",
+    "<b>Hidden Odds:</b> You're gambling without knowing your true chances of winning.",
+    "<b>Trust Requirements:</b> You must trust that the company won't manipulate outcomes.",
+))
+
+_JOURNALIST_RECS_HTML = "<br/><br/>".join((
+    "<b>Focus on Centralization:</b> The key issue is oracle control, not cryptographic validity.",
+    "<b>Compare to Standards:</b> Contrast with truly decentralized systems like Chainlink VRF.",
+    "<b>Investigate Patterns:</b> Look for suspicious win patterns from specific wallets.",
+    "<b>Regulatory Gaps:</b> Highlight the lack of oversight in crypto gambling.",
+))
+
+_PLATFORM_RECS_HTML = "<br/><br/>".join((
+    "<b>Decentralize Oracles:</b> Use independent third-party oracle providers.",
+    "<b>Publish Odds:</b> Disclose win probabilities for all games.",
+    "<b>Independent Audit:</b> Have RNG and fairness audited by external firms.",
+    "<b>Transparency Reports:</b> Publish regular fairness and operation reports.",
+))
+
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Generate ultimate comprehensive gambling analysis report.")
     parser.add_argument("--tx-url", required=True, help="Solscan transaction URL")
     parser.add_argument("--proov-url", required=True, help="Proov VRF record URL")
     parser.add_argument("--output", default="/Users/devilla/work/lucky.io/reports/ultimate_gambling_analysis.pdf", help="Output PDF path")
+    parser.add_argument("--no-compress", dest="compress", action="store_false",
+                        help="Skip zlib page-stream compression (faster iterative builds, larger PDF)")
+    parser.add_argument("--no-cache", dest="cache", action="store_false",
+                        help="Ignore the on-disk Proov response cache and refetch")
     return parser.parse_args()
 
 
@@ -115,7 +232,7 @@ def create_custom_styles():
         borderWidth=2,
         borderColor=COLORS['warning'],
         borderPadding=12,
-        backColor=colors.HexColor('#fef2f2')
+        backColor=WARNING_BG
     ))
     
     styles.add(ParagraphStyle(
@@ -146,19 +263,54 @@ def extract_signature_from_solscan_url(url: str) -> Optional[str]:
         return None
 
 
+def _parse_proov_url(url: str) -> Tuple[Optional[str], Optional[int]]:
+    """Extract (balance_address, nonce) from a Proov verification URL.
+
+    The URL is trusted input with two known keys, so a plain split beats
+    dragging in urllib.parse for a full query dict.
+    """
+    try:
+        query = url.partition("?")[2]
+        kv = dict(p.split("=", 1) for p in query.split("&") if "=" in p)
+        address = kv.get("balance_address")
+        nonce = int(kv["nonce"]) if kv.get("nonce") else None
+        return address, nonce
+    except Exception:
+        return None, None
+
+
 def solana_rpc_request(method: str, params: Any) -> Dict[str, Any]:
     payload = {"jsonrpc": "2.0", "id": 1, "method": method, "params": params}
-    resp = requests.post(PUBLIC_SOLANA_RPC, json=payload, timeout=25)
+    resp = _http_post_json(PUBLIC_SOLANA_RPC, payload)
     resp.raise_for_status()
-    return resp.json()
+    # getTransaction responses run to hundreds of KB; orjson parses them
+    # several times faster than the stdlib decoder when installed.
+    return orjson.loads(resp.content) if orjson is not None else resp.json()
+
+
+def solana_rpc_batch(calls: List[Tuple[str, Any]]) -> List[Dict[str, Any]]:
+    """POST several RPC methods as one JSON-RPC batch array (single round trip)."""
+    payload = [
+        {"jsonrpc": "2.0", "id": i, "method": method, "params": params}
+        for i, (method, params) in enumerate(calls)
+    ]
+    resp = _http_post_json(PUBLIC_SOLANA_RPC, payload)
+    resp.raise_for_status()
+    results = orjson.loads(resp.content) if orjson is not None else resp.json()
+    # Responses may arrive out of order; match them back up by id.
+    return sorted(results, key=lambda r: r.get("id", 0))
 
 
 def fetch_transaction(signature: str) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
     try:
-        result = solana_rpc_request(
+        # The report only checks that the transaction exists on-chain; ask
+        # the RPC for the slimmest payload instead of the full jsonParsed
+        # instruction dump (100s of KB for busy transactions).
+        result = solana_rpc_batch([(
             "getTransaction",
-            [signature, {"encoding": "jsonParsed", "maxSupportedTransactionVersion": 0}],
-        )
+            [signature, {"encoding": "json", "transactionDetails": "accounts",
+                         "rewards": False, "maxSupportedTransactionVersion": 0}],
+        )])[0]
         if "error" in result:
             return None, f"RPC error: {result['error']}"
         return result.get("result"), None
@@ -166,33 +318,84 @@ def fetch_transaction(signature: str) -> Tuple[Optional[Dict[str, Any]], Optiona
         return None, f"Exception fetching transaction: {e}"
 
 
+_CACHE_DIR = os.path.expanduser("~/.cache/luck.io/proov")
+_CACHE_TTL = 86400  # a bet is immutable; a day just bounds disk growth
+_cache_enabled = True
+
+
+def _cache_path(address: str, nonce: int) -> str:
+    key = hashlib.blake2b(f"{address}:{nonce}".encode()).hexdigest()
+    return os.path.join(_CACHE_DIR, key + ".json")
+
+
+def _cache_read(path: str) -> Optional[Dict[str, Any]]:
+    try:
+        if time.time() - os.path.getmtime(path) > _CACHE_TTL:
+            return None
+        with open(path, "rb") as fh:
+            raw = fh.read()
+        return orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except Exception:
+        return None
+
+
+def _cache_write(path: str, data: Dict[str, Any]) -> None:
+    try:
+        os.makedirs(_CACHE_DIR, exist_ok=True)
+        raw = orjson.dumps(data) if orjson is not None else json.dumps(data).encode()
+        with open(path, "wb") as fh:
+            fh.write(raw)
+    except Exception:
+        pass  # cache is best-effort; never fail the report over it
+
+
 def fetch_proov_api_data(address: str, nonce: int) -> Dict[str, Any]:
     """Fetch comprehensive data from Proov API"""
     PROOV_BASE_URL = 'https://rpc1.proov.network'
     data = {}
-    
+
+    # (address, nonce) keys an immutable bet, so repeated report runs can
+    # skip the three GETs entirely.
+    cache_path = _cache_path(address, nonce)
+    if _cache_enabled:
+        cached = _cache_read(cache_path)
+        if cached is not None:
+            return cached
+
     try:
-        bet_resp = requests.get(f"{PROOV_BASE_URL}/solana/bets/{address}/{nonce}", timeout=20)
+        bet_resp = _http_get(f"{PROOV_BASE_URL}/solana/bets/{address}/{nonce}")
         if bet_resp.status_code == 200:
-            bet_data = bet_resp.json()
+            bet_data = orjson.loads(bet_resp.content) if orjson is not None else bet_resp.json()
             data["bet_data"] = bet_data
-            
+
+            # The user and distribution lookups depend only on bet_data, so
+            # run them concurrently; both are plain blocking GETs releasing
+            # the GIL during socket I/O.
             user_key = bet_data.get("user_key")
-            if user_key:
-                user_resp = requests.get(f"{PROOV_BASE_URL}/solana/login/key/{user_key}", timeout=20)
-                if user_resp.status_code == 200:
-                    user_data = user_resp.json()
-                    data["user_data"] = user_data
-                    
             distribution_id = bet_data.get("distribution_id")
-            if distribution_id:
-                dist_resp = requests.get(f"{PROOV_BASE_URL}/games/distributions/{distribution_id}", timeout=20)
-                if dist_resp.status_code == 200:
-                    data["game_distribution"] = dist_resp.json()
-                    
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                f_user = pool.submit(
+                    _http_get, f"{PROOV_BASE_URL}/solana/login/key/{user_key}"
+                ) if user_key else None
+                f_dist = pool.submit(
+                    _http_get, f"{PROOV_BASE_URL}/games/distributions/{distribution_id}"
+                ) if distribution_id else None
+
+                if f_user is not None:
+                    user_resp = f_user.result()
+                    if user_resp.status_code == 200:
+                        data["user_data"] = orjson.loads(user_resp.content) if orjson is not None else user_resp.json()
+
+                if f_dist is not None:
+                    dist_resp = f_dist.result()
+                    if dist_resp.status_code == 200:
+                        data["game_distribution"] = orjson.loads(dist_resp.content) if orjson is not None else dist_resp.json()
+
     except Exception as e:
         data["api_error"] = str(e)
-    
+
+    if _cache_enabled and data and "api_error" not in data:
+        _cache_write(cache_path, data)
     return data
 
 
@@ -200,86 +403,156 @@ def ensure_dir(path: str) -> None:
     os.makedirs(os.path.dirname(path), exist_ok=True)
 
 
+_MIDDLE = sys.intern('middle')
+_HELVETICA_BOLD = sys.intern('Helvetica-Bold')
+
+
+def _hbold(x: float, y: float, text: str, size: int = 10, fill: Any = None) -> String:
+    """Flyweight factory for the centred bold labels the diagrams repeat."""
+    s = String(x, y, text, textAnchor=_MIDDLE, fontSize=size, fontName=_HELVETICA_BOLD)
+    if fill is not None:
+        s.fillColor = fill
+    return s
+
+
+def _hlabel(x: float, y: float, text: str, size: int = 10, fill: Any = None) -> String:
+    """Flyweight factory for centred plain-face labels."""
+    s = String(x, y, text, textAnchor=_MIDDLE, fontSize=size)
+    if fill is not None:
+        s.fillColor = fill
+    return s
+
+
+# Static data for the diagram builders, hoisted to module scope so the
+# (cached) builders only do drawing work, not literal re-construction.
+_JOURNEY_STEPS = (
+    (130, 420, "1", "Player Action", ("• Click 'SPIN'", "• Money leaves wallet", "• Bet recorded"), COLORS['accent']),
+    (390, 420, "2", "Oracle Network", ("• VRF proof generated", "• Multiple signatures", "• Cryptographically valid"), COLORS['crypto']),
+    (130, 320, "3", "Game Algorithm", ("• Randomness processed", "• Outcome calculated", "• Payout determined"), COLORS['algorithm']),
+    (390, 320, "4", "Result Display", ("• Outcome shown", "• Transaction posted", "• Blockchain record"), COLORS['success']),
+    (260, 220, "5", "Verification", ("• 7-step process", "• Cryptographic proof", "• Mathematical validity"), COLORS['highlight']),
+)
+
+_RISK_MATRIX_ROWS = (
+    ("Technical Risk", "Oracle Centralization", "HIGH", COLORS['warning']),
+    ("Financial Risk", "Payout Manipulation", "HIGH", COLORS['warning']),
+    ("Legal Risk", "No Regulatory Protection", "HIGH", COLORS['warning']),
+    ("Transparency Risk", "Hidden Odds", "HIGH", COLORS['warning']),
+    ("Verification Risk", "Limited Audit Scope", "MEDIUM", COLORS['caution']),
+    ("Operational Risk", "Key Management", "MEDIUM", COLORS['caution']),
+)
+
+_ESLOT_FLOW_STEPS = (
+    (100, 280, "VRF Input", ("Cryptographic", "randomness")),
+    (220, 280, "Hash to Int", ("Convert to", "uniform integer")),
+    (340, 280, "Weight Map", ("Map to outcome", "weight ranges")),
+    (460, 280, "Multiplier", ("Calculate final", "payout amount")),
+    (100, 180, "Distribution", ("5000x: 100 weight", "1000x: 400 weight", "...")),
+    (220, 180, "Total Weight", ("Sum all possible", "outcome weights")),
+    (340, 180, "Selection", ("Random integer", "selects outcome")),
+    (460, 180, "Verification", ("Math can be", "independently verified")),
+)
+
+_VERIFICATION_STEPS = (
+    ("1", "Login Signature", "Wallet signs login message", "✓ SECURE", COLORS['success']),
+    ("2", "Bet Request", "Auth key signs bet request", "✓ SECURE", COLORS['success']),
+    ("3", "Oracle VRF", "Oracles generate VRF proof", "⚠️ TRUST REQUIRED", COLORS['caution']),
+    ("4", "Payout Calc", "Algorithm calculates payout", "✓ VERIFIABLE", COLORS['success']),
+    ("5", "Shard Award", "Bonus shard calculation", "✓ VERIFIABLE", COLORS['success']),
+    ("6", "Settlement", "Settlement math verification", "✓ VERIFIABLE", COLORS['success']),
+    ("7", "Blockchain", "On-chain transaction match", "✓ VERIFIABLE", COLORS['success']),
+)
+
+_VERIFICATION_POSITIONS = (
+    (100, 380), (260, 380), (420, 380),  # Top row
+    (100, 280), (260, 280), (420, 280),  # Middle row
+    (260, 180),  # Bottom center
+)
+
+_VERIFICATION_CONNECTIONS = ((0, 1), (1, 2), (2, 5), (5, 4), (4, 3), (3, 6))
+
+
+def _add_step_box(shapes: List[Any], x: float, y: float, w: float, h: float, color: Any,
+                  title: str, lines: Tuple[str, ...], num: Optional[str] = None,
+                  shadow: bool = False, title_size: int = 10, line_size: int = 8,
+                  num_r: int = 12, num_size: int = 10,
+                  _white: Any = colors.white) -> None:
+    """Add one labelled step box; constants are bound once as defaults."""
+    add = shapes.append
+    half_w, half_h = w / 2, h / 2
+    add(Rect(x - half_w, y - half_h, w, h, fillColor=_white, strokeColor=color,
+             strokeWidth=3 if shadow else 2))
+    if shadow:
+        add(Rect(x - half_w + 2, y - half_h + 2, w, h, fillColor=color,
+                 strokeColor=color, strokeWidth=1))
+    if num is not None:
+        cx, cy = x - half_w + 20 - (0 if shadow else 5), y + half_h - 15
+        add(Circle(cx, cy, num_r, fillColor=color, strokeColor=_white, strokeWidth=2))
+        add(_hbold(cx, cy - 4 + (0 if shadow else 1), num, size=num_size, fill=_white))
+    add(_hbold(x, y + (15 if shadow else 10), title, size=title_size))
+    for i, line in enumerate(lines):
+        add(_hlabel(x, y - 5 - i * 10, line, size=line_size))
+
+
+@functools.lru_cache(maxsize=1)
 def create_complete_player_journey() -> Drawing:
     """Enhanced player journey with all details"""
     d = Drawing(520, 500)
-    
-    d.add(String(260, 480, "Complete Player Journey: What REALLY Happens", 
-                textAnchor='middle', fontSize=16, fontName="Helvetica-Bold"))
-    
-    # Enhanced journey steps
-    steps = [
-        (130, 420, "1", "Player Action", "• Click 'SPIN'\n• Money leaves wallet\n• Bet recorded", COLORS['accent']),
-        (390, 420, "2", "Oracle Network", "• VRF proof generated\n• Multiple signatures\n• Cryptographically valid", COLORS['crypto']),
-        (130, 320, "3", "Game Algorithm", "• Randomness processed\n• Outcome calculated\n• Payout determined", COLORS['algorithm']),
-        (390, 320, "4", "Result Display", "• Outcome shown\n• Transaction posted\n• Blockchain record", COLORS['success']),
-        (260, 220, "5", "Verification", "• 7-step process\n• Cryptographic proof\n• Mathematical validity", COLORS['highlight']),
-    ]
-    
-    for x, y, num, title, desc, color in steps:
-        # Enhanced boxes with shadows
-        d.add(Rect(x-60, y-35, 120, 70, fillColor=colors.white, strokeColor=color, strokeWidth=3))
-        d.add(Rect(x-58, y-33, 120, 70, fillColor=color, strokeColor=color, strokeWidth=1))  # Shadow
-        
-        # Step number with better styling
-        d.add(Circle(x-40, y+20, 15, fillColor=color, strokeColor=colors.white, strokeWidth=2))
-        d.add(String(x-40, y+16, num, textAnchor='middle', fontSize=12, fontName="Helvetica-Bold", fillColor=colors.white))
-        
-        # Title and description
-        d.add(String(x, y+15, title, textAnchor='middle', fontSize=12, fontName="Helvetica-Bold"))
-        lines = desc.split('\n')
-        for i, line in enumerate(lines):
-            d.add(String(x, y-5-i*10, line, textAnchor='middle', fontSize=9))
-    
+    # Collect primitives locally; one C-level extend beats dozens of
+    # d.add dispatches.
+    shapes: List[Any] = []
+    add = shapes.append
+
+    add(_hbold(260, 480, "Complete Player Journey: What REALLY Happens", size=16))
+
+    for x, y, num, title, lines, color in _JOURNEY_STEPS:
+        _add_step_box(shapes, x, y, 120, 70, color, title, lines, num=num, shadow=True,
+                      title_size=12, line_size=9, num_r=15, num_size=12)
+
     # Enhanced arrows with better styling
     arrow_props = {'strokeColor': COLORS['primary'], 'strokeWidth': 3}
     
     # 1 -> 2
-    d.add(Line(190, 420, 330, 420, **arrow_props))
-    d.add(Polygon([325, 415, 330, 420, 325, 425], fillColor=COLORS['primary'], strokeColor=COLORS['primary']))
+    add(Line(190, 420, 330, 420, **arrow_props))
+    add(Polygon([325, 415, 330, 420, 325, 425], fillColor=COLORS['primary'], strokeColor=COLORS['primary']))
     
     # 2 -> 3 (curved)
-    d.add(Line(390, 385, 390, 365, **arrow_props))
-    d.add(Line(390, 365, 190, 355, **arrow_props))
-    d.add(Polygon([195, 350, 190, 355, 195, 360], fillColor=COLORS['primary'], strokeColor=COLORS['primary']))
+    add(Line(390, 385, 390, 365, **arrow_props))
+    add(Line(390, 365, 190, 355, **arrow_props))
+    add(Polygon([195, 350, 190, 355, 195, 360], fillColor=COLORS['primary'], strokeColor=COLORS['primary']))
     
     # 3 -> 4
-    d.add(Line(190, 320, 330, 320, **arrow_props))
-    d.add(Polygon([325, 315, 330, 320, 325, 325], fillColor=COLORS['primary'], strokeColor=COLORS['primary']))
+    add(Line(190, 320, 330, 320, **arrow_props))
+    add(Polygon([325, 315, 330, 320, 325, 325], fillColor=COLORS['primary'], strokeColor=COLORS['primary']))
     
     # 4 -> 5
-    d.add(Line(390, 285, 390, 265, **arrow_props))
-    d.add(Line(390, 265, 320, 255, **arrow_props))
-    d.add(Polygon([325, 250, 320, 255, 325, 260], fillColor=COLORS['primary'], strokeColor=COLORS['primary']))
+    add(Line(390, 285, 390, 265, **arrow_props))
+    add(Line(390, 265, 320, 255, **arrow_props))
+    add(Polygon([325, 250, 320, 255, 325, 260], fillColor=COLORS['primary'], strokeColor=COLORS['primary']))
     
     # Major warning box
-    d.add(Rect(30, 80, 460, 120, fillColor=colors.HexColor('#fef2f2'), strokeColor=COLORS['warning'], strokeWidth=3))
-    d.add(String(260, 175, "🚨 CRITICAL TRUST ISSUES", textAnchor='middle', fontSize=14, fontName="Helvetica-Bold", fillColor=COLORS['warning']))
-    d.add(String(260, 155, "1. All oracles controlled by same company - no independence", textAnchor='middle', fontSize=11))
-    d.add(String(260, 140, "2. Verification only checks math, not oracle coordination", textAnchor='middle', fontSize=11))
-    d.add(String(260, 125, "3. No external oversight or independent auditing", textAnchor='middle', fontSize=11))
-    d.add(String(260, 110, "4. Players must trust company won't manipulate outcomes", textAnchor='middle', fontSize=11))
-    d.add(String(260, 95, "5. No legal recourse if manipulation is discovered", textAnchor='middle', fontSize=11))
-    
+    add(Rect(30, 80, 460, 120, fillColor=WARNING_BG, strokeColor=COLORS['warning'], strokeWidth=3))
+    add(_hbold(260, 175, "🚨 CRITICAL TRUST ISSUES", size=14, fill=COLORS['warning']))
+    add(_hlabel(260, 155, "1. All oracles controlled by same company - no independence", size=11))
+    add(_hlabel(260, 140, "2. Verification only checks math, not oracle coordination", size=11))
+    add(_hlabel(260, 125, "3. No external oversight or independent auditing", size=11))
+    add(_hlabel(260, 110, "4. Players must trust company won't manipulate outcomes", size=11))
+    add(_hlabel(260, 95, "5. No legal recourse if manipulation is discovered", size=11))
+    
+    d.contents.extend(shapes)
     return d
 
 
+@functools.lru_cache(maxsize=1)
 def create_comprehensive_risk_matrix() -> Drawing:
     """Create detailed risk assessment matrix"""
     d = Drawing(520, 400)
+    # Collect primitives locally; one C-level extend beats dozens of
+    # d.add dispatches.
+    shapes: List[Any] = []
+    add = shapes.append
     
-    d.add(String(260, 380, "Comprehensive Risk Assessment Matrix", 
-                textAnchor='middle', fontSize=16, fontName="Helvetica-Bold"))
-    
-    # Risk categories
-    risks = [
-        ("Technical Risk", "Oracle Centralization", "HIGH", COLORS['warning']),
-        ("Financial Risk", "Payout Manipulation", "HIGH", COLORS['warning']),
-        ("Legal Risk", "No Regulatory Protection", "HIGH", COLORS['warning']),
-        ("Transparency Risk", "Hidden Odds", "HIGH", COLORS['warning']),
-        ("Verification Risk", "Limited Audit Scope", "MEDIUM", COLORS['caution']),
-        ("Operational Risk", "Key Management", "MEDIUM", COLORS['caution']),
-    ]
+    add(_hbold(260, 380, "Comprehensive Risk Assessment Matrix", size=16))
     
     # Create risk matrix
     start_x = 60
@@ -288,223 +561,256 @@ def create_comprehensive_risk_matrix() -> Drawing:
     box_height = 45
     spacing = 50
     
-    for i, (category, description, level, color) in enumerate(risks):
+    for i, (category, description, level, color) in enumerate(_RISK_MATRIX_ROWS):
         col = i % 3
         row = i // 3
         x = start_x + col * (box_width + spacing)
         y = start_y - row * (box_height + spacing)
         
         # Risk box
-        d.add(Rect(x, y, box_width, box_height, fillColor=colors.white, strokeColor=color, strokeWidth=2))
+        add(Rect(x, y, box_width, box_height, fillColor=colors.white, strokeColor=color, strokeWidth=2))
         
         # Risk level indicator
         level_color = COLORS['warning'] if level == "HIGH" else COLORS['caution']
-        d.add(Rect(x + 5, y + box_height - 15, 30, 10, fillColor=level_color, strokeColor=level_color))
-        d.add(String(x + 20, y + box_height - 12, level, textAnchor='middle', fontSize=8, 
-                    fontName="Helvetica-Bold", fillColor=colors.white))
+        add(Rect(x + 5, y + box_height - 15, 30, 10, fillColor=level_color, strokeColor=level_color))
+        add(_hbold(x + 20, y + box_height - 12, level, size=8, fill=colors.white))
         
         # Category and description
-        d.add(String(x + box_width//2, y + 25, category, textAnchor='middle', fontSize=10, fontName="Helvetica-Bold"))
-        d.add(String(x + box_width//2, y + 10, description, textAnchor='middle', fontSize=9))
+        add(_hbold(x + box_width//2, y + 25, category, size=10))
+        add(_hlabel(x + box_width//2, y + 10, description, size=9))
     
     # Legend
-    d.add(Rect(60, 80, 400, 60, fillColor=COLORS['background'], strokeColor=COLORS['light'], strokeWidth=1))
-    d.add(String(260, 125, "Risk Level Guide", textAnchor='middle', fontSize=12, fontName="Helvetica-Bold"))
-    d.add(Rect(80, 105, 20, 10, fillColor=COLORS['warning'], strokeColor=COLORS['warning']))
-    d.add(String(110, 108, "HIGH: Significant player risk, minimal protection", fontSize=10))
-    d.add(Rect(80, 90, 20, 10, fillColor=COLORS['caution'], strokeColor=COLORS['caution']))
-    d.add(String(110, 93, "MEDIUM: Moderate risk, some mitigation possible", fontSize=10))
-    
+    add(Rect(60, 80, 400, 60, fillColor=COLORS['background'], strokeColor=COLORS['light'], strokeWidth=1))
+    add(_hbold(260, 125, "Risk Level Guide", size=12))
+    add(Rect(80, 105, 20, 10, fillColor=COLORS['warning'], strokeColor=COLORS['warning']))
+    add(String(110, 108, "HIGH: Significant player risk, minimal protection", fontSize=10))
+    add(Rect(80, 90, 20, 10, fillColor=COLORS['caution'], strokeColor=COLORS['caution']))
+    add(String(110, 93, "MEDIUM: Moderate risk, some mitigation possible", fontSize=10))
+    
+    d.contents.extend(shapes)
     return d
 
 
 def create_algorithm_flow_diagram(game_name: str) -> Drawing:
     """Create enhanced algorithm flow for specific game"""
+    return _algorithm_flow_cached(game_name.lower())
+
+
+@functools.lru_cache(maxsize=8)
+def _algorithm_flow_cached(game_name: str) -> Drawing:
+    """Build (once per game) the static algorithm flow drawing."""
     d = Drawing(520, 350)
+    # Collect primitives locally; one C-level extend beats dozens of
+    # d.add dispatches.
+    shapes: List[Any] = []
+    add = shapes.append
     
-    d.add(String(260, 330, f"{game_name.upper()} Algorithm Flow Analysis", 
-                textAnchor='middle', fontSize=16, fontName="Helvetica-Bold"))
+    add(_hbold(260, 330, f"{game_name.upper()} Algorithm Flow Analysis", size=16))
     
     if game_name.lower() == "madamefortune" or "eslot" in game_name.lower():
-        # ESLot detailed flow
-        steps = [
-            (100, 280, "VRF Input", "Cryptographic\nrandomness"),
-            (220, 280, "Hash to Int", "Convert to\nuniform integer"),
-            (340, 280, "Weight Map", "Map to outcome\nweight ranges"),
-            (460, 280, "Multiplier", "Calculate final\npayout amount"),
-            (100, 180, "Distribution", "5000x: 100 weight\n1000x: 400 weight\n..."),
-            (220, 180, "Total Weight", "Sum all possible\noutcome weights"),
-            (340, 180, "Selection", "Random integer\nselects outcome"),
-            (460, 180, "Verification", "Math can be\nindependently verified"),
-        ]
-        
-        for i, (x, y, title, desc) in enumerate(steps):
-            color = COLORS['algorithm'] if i < 4 else COLORS['crypto']
-            d.add(Rect(x-35, y-25, 70, 50, fillColor=colors.white, strokeColor=color, strokeWidth=2))
-            d.add(String(x, y+10, title, textAnchor='middle', fontSize=10, fontName="Helvetica-Bold"))
-            lines = desc.split('\n')
-            for j, line in enumerate(lines):
-                d.add(String(x, y-5-j*10, line, textAnchor='middle', fontSize=8))
-        
+        algo_color, crypto_color = COLORS['algorithm'], COLORS['crypto']
+        for i, (x, y, title, lines) in enumerate(_ESLOT_FLOW_STEPS):
+            _add_step_box(shapes, x, y, 70, 50, algo_color if i < 4 else crypto_color,
+                          title, lines)
+
         # Flow arrows
         arrow_props = {'strokeColor': COLORS['primary'], 'strokeWidth': 2}
         for i in range(3):
             x1 = 100 + i * 120 + 35
             x2 = 100 + (i+1) * 120 - 35
-            d.add(Line(x1, 280, x2, 280, **arrow_props))
-            d.add(Polygon([x2-5, 275, x2, 280, x2-5, 285], fillColor=COLORS['primary'], strokeColor=COLORS['primary']))
+            add(Line(x1, 280, x2, 280, **arrow_props))
+            add(Polygon([x2-5, 275, x2, 280, x2-5, 285], fillColor=COLORS['primary'], strokeColor=COLORS['primary']))
     
     # Critical analysis box
-    d.add(Rect(50, 50, 420, 80, fillColor=colors.HexColor('#fef2f2'), strokeColor=COLORS['warning'], strokeWidth=2))
-    d.add(String(260, 115, "🔍 ALGORITHM ANALYSIS", textAnchor='middle', fontSize=12, fontName="Helvetica-Bold", fillColor=COLORS['warning']))
-    d.add(String(260, 95, "✓ Mathematics are sound and verifiable", textAnchor='middle', fontSize=10))
-    d.add(String(260, 80, "✓ Code implementation matches published algorithms", textAnchor='middle', fontSize=10))
-    d.add(String(260, 65, "⚠️ BUT: Randomness source is controlled by single entity", textAnchor='middle', fontSize=10, fillColor=COLORS['warning']))
+    add(Rect(50, 50, 420, 80, fillColor=WARNING_BG, strokeColor=COLORS['warning'], strokeWidth=2))
+    add(_hbold(260, 115, "🔍 ALGORITHM ANALYSIS", size=12, fill=COLORS['warning']))
+    add(_hlabel(260, 95, "✓ Mathematics are sound and verifiable", size=10))
+    add(_hlabel(260, 80, "✓ Code implementation matches published algorithms", size=10))
+    add(_hlabel(260, 65, "⚠️ BUT: Randomness source is controlled by single entity", size=10, fill=COLORS['warning']))
     
+    d.contents.extend(shapes)
     return d
 
 
+@functools.lru_cache(maxsize=1)
 def create_verification_detailed_flow() -> Drawing:
     """Create detailed verification process flow"""
     d = Drawing(520, 450)
+    # Collect primitives locally; one C-level extend beats dozens of
+    # d.add dispatches.
+    shapes: List[Any] = []
+    add = shapes.append
     
-    d.add(String(260, 430, "Proov's 7-Step Verification Process (Detailed)", 
-                textAnchor='middle', fontSize=16, fontName="Helvetica-Bold"))
-    
-    # Verification steps with detailed analysis
-    steps = [
-        ("1", "Login Signature", "Wallet signs login message", "✓ SECURE", COLORS['success']),
-        ("2", "Bet Request", "Auth key signs bet request", "✓ SECURE", COLORS['success']),
-        ("3", "Oracle VRF", "Oracles generate VRF proof", "⚠️ TRUST REQUIRED", COLORS['caution']),
-        ("4", "Payout Calc", "Algorithm calculates payout", "✓ VERIFIABLE", COLORS['success']),
-        ("5", "Shard Award", "Bonus shard calculation", "✓ VERIFIABLE", COLORS['success']),
-        ("6", "Settlement", "Settlement math verification", "✓ VERIFIABLE", COLORS['success']),
-        ("7", "Blockchain", "On-chain transaction match", "✓ VERIFIABLE", COLORS['success']),
-    ]
-    
-    # Arrange in a flow pattern
-    positions = [
-        (100, 380), (260, 380), (420, 380),  # Top row
-        (100, 280), (260, 280), (420, 280),  # Middle row  
-        (260, 180)  # Bottom center
-    ]
-    
-    for i, ((x, y), (num, title, desc, status, color)) in enumerate(zip(positions, steps)):
-        # Step box
-        box_color = COLORS['caution'] if "TRUST" in status else COLORS['success']
-        d.add(Rect(x-50, y-30, 100, 60, fillColor=colors.white, strokeColor=box_color, strokeWidth=2))
-        
-        # Step number
-        d.add(Circle(x-35, y+15, 12, fillColor=box_color, strokeColor=colors.white))
-        d.add(String(x-35, y+12, num, textAnchor='middle', fontSize=10, fontName="Helvetica-Bold", fillColor=colors.white))
-        
-        # Content
-        d.add(String(x, y+10, title, textAnchor='middle', fontSize=10, fontName="Helvetica-Bold"))
-        d.add(String(x, y-5, desc, textAnchor='middle', fontSize=8))
-        d.add(String(x, y-20, status, textAnchor='middle', fontSize=8, fontName="Helvetica-Bold", 
-                    fillColor=COLORS['warning'] if "TRUST" in status else COLORS['success']))
+    add(_hbold(260, 430, "Proov's 7-Step Verification Process (Detailed)", size=16))
     
+    caution, success, warning = COLORS['caution'], COLORS['success'], COLORS['warning']
+    for (x, y), (num, title, desc, status, color) in zip(_VERIFICATION_POSITIONS, _VERIFICATION_STEPS):
+        trust = "TRUST" in status
+        _add_step_box(shapes, x, y, 100, 60, caution if trust else success,
+                      title, (desc,), num=num)
+        add(_hbold(x, y-20, status, size=8, fill=warning if trust else success))
+
     # Connection arrows between steps
-    connections = [(0,1), (1,2), (2,5), (5,4), (4,3), (3,6)]
-    for start_idx, end_idx in connections:
-        start_x, start_y = positions[start_idx]
-        end_x, end_y = positions[end_idx]
+    for start_idx, end_idx in _VERIFICATION_CONNECTIONS:
+        start_x, start_y = _VERIFICATION_POSITIONS[start_idx]
+        end_x, end_y = _VERIFICATION_POSITIONS[end_idx]
         
         # Simple line connection
         if start_y == end_y:  # Same row
             direction = 1 if end_x > start_x else -1
-            d.add(Line(start_x + 50*direction, start_y, end_x - 50*direction, end_y, strokeColor=COLORS['primary'], strokeWidth=2))
+            add(Line(start_x + 50*direction, start_y, end_x - 50*direction, end_y, strokeColor=COLORS['primary'], strokeWidth=2))
         else:  # Different rows
-            d.add(Line(start_x, start_y-30, end_x, end_y+30, strokeColor=COLORS['primary'], strokeWidth=2))
+            add(Line(start_x, start_y-30, end_x, end_y+30, strokeColor=COLORS['primary'], strokeWidth=2))
     
     # Critical warning about step 3
-    d.add(Rect(50, 80, 420, 70, fillColor=colors.HexColor('#fef2f2'), strokeColor=COLORS['warning'], strokeWidth=2))
-    d.add(String(260, 135, "⚠️ STEP 3 CRITICAL ANALYSIS", textAnchor='middle', fontSize=12, fontName="Helvetica-Bold", fillColor=COLORS['warning']))
-    d.add(String(260, 115, "VRF verification only confirms cryptographic validity", textAnchor='middle', fontSize=10))
-    d.add(String(260, 100, "It does NOT verify oracle independence or prevent coordination", textAnchor='middle', fontSize=10))
-    d.add(String(260, 85, "All oracles could be controlled by the same entity", textAnchor='middle', fontSize=10))
+    add(Rect(50, 80, 420, 70, fillColor=WARNING_BG, strokeColor=COLORS['warning'], strokeWidth=2))
+    add(_hbold(260, 135, "⚠️ STEP 3 CRITICAL ANALYSIS", size=12, fill=COLORS['warning']))
+    add(_hlabel(260, 115, "VRF verification only confirms cryptographic validity", size=10))
+    add(_hlabel(260, 100, "It does NOT verify oracle independence or prevent coordination", size=10))
+    add(_hlabel(260, 85, "All oracles could be controlled by the same entity", size=10))
     
+    d.contents.extend(shapes)
     return d
 
 
-def create_styled_table(data: List[List[str]], headers: bool = True, 
-                       col_widths: List[float] = None, 
+# The base and header command tuples never change between tables; build the
+# lists once so each create_styled_table call only copies and appends.
+_BASE_STYLE_COMMANDS = [
+    ("BOX", (0, 0), (-1, -1), 1.5, COLORS['light']),
+    ("INNERGRID", (0, 0), (-1, -1), 0.75, COLORS['light']),
+    ("FONTSIZE", (0, 0), (-1, -1), 10),
+    ("VALIGN", (0, 0), (-1, -1), "TOP"),
+    ("FONTNAME", (0, 0), (-1, -1), "Helvetica"),
+]
+_HEADER_STYLE_COMMANDS = [
+    ("BACKGROUND", (0, 0), (-1, 0), COLORS['accent']),
+    ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
+    ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+    ("FONTSIZE", (0, 0), (-1, 0), 11),
+]
+
+
+def _row_background_commands(rows: List[int], color: Any) -> List[Tuple[Any, ...]]:
+    """Collapse row indices into one BACKGROUND command per contiguous run."""
+    commands = []
+    for _, run in itertools.groupby(enumerate(sorted(rows)), key=lambda p: p[1] - p[0]):
+        run = list(run)
+        start, end = run[0][1], run[-1][1]
+        commands.append(("BACKGROUND", (0, start), (-1, end), color))
+    return commands
+
+
+def create_styled_table(data: List[List[str]], headers: bool = True,
+                       col_widths: List[float] = None,
                        warning_rows: List[int] = None,
                        success_rows: List[int] = None) -> Table:
     """Create enhanced styled table"""
     if col_widths is None:
         col_widths = [2*inch] * len(data[0])
-    
+
     table = Table(data, repeatRows=1 if headers else 0, hAlign="LEFT", colWidths=col_widths)
-    
-    style_commands = [
-        ("BOX", (0,0), (-1,-1), 1.5, COLORS['light']),
-        ("INNERGRID", (0,0), (-1,-1), 0.75, COLORS['light']),
-        ("FONTSIZE", (0,0), (-1,-1), 10),
-        ("VALIGN", (0,0), (-1,-1), "TOP"),
-        ("FONTNAME", (0,0), (-1,-1), "Helvetica"),
-    ]
-    
+
+    style_commands = list(_BASE_STYLE_COMMANDS)
+
     if headers:
-        style_commands.extend([
-            ("BACKGROUND", (0, 0), (-1, 0), COLORS['accent']),
-            ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
-            ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-            ("FONTSIZE", (0, 0), (-1, 0), 11),
-        ])
-    
+        style_commands.extend(_HEADER_STYLE_COMMANDS)
+
     if warning_rows:
-        for row in warning_rows:
-            style_commands.append(("BACKGROUND", (0, row), (-1, row), colors.HexColor('#fef2f2')))
-    
+        style_commands.extend(_row_background_commands(warning_rows, WARNING_BG))
+
     if success_rows:
-        for row in success_rows:
-            style_commands.append(("BACKGROUND", (0, row), (-1, row), colors.HexColor('#f0fdf4')))
-    
+        style_commands.extend(_row_background_commands(success_rows, SUCCESS_BG))
+
     table.setStyle(TableStyle(style_commands))
     return table
 
 
+def build_report_context(tx_url: str, proov_url: str) -> Dict[str, Any]:
+    """Assemble every input the report needs into one renderer-agnostic dict.
+
+    Keeping data collection separate from the platypus story means an
+    alternative rendering backend (e.g. an HTML template) only needs this
+    context, not the fetch logic.
+    """
+    signature = extract_signature_from_solscan_url(tx_url)
+    context: Dict[str, Any] = {"signature": signature, "tx_url": tx_url, "proov_url": proov_url}
+    if not signature:
+        return context
+
+    address, nonce = _parse_proov_url(proov_url)
+
+    # The Solana RPC and the Proov API are unrelated hosts; fetch both at
+    # once so the network stall is the max of the two, not the sum.
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        f_tx = ex.submit(fetch_transaction, signature)
+        f_proov = ex.submit(fetch_proov_api_data, address, nonce) if address and nonce else None
+        tx, err = f_tx.result()
+        proov_api_data = f_proov.result() if f_proov is not None else {}
+
+    context["tx"] = tx
+    context["tx_error"] = err
+    context["proov_api_data"] = proov_api_data
+    game_name = "MadameFortune"
+    if proov_api_data.get("bet_data"):
+        game_name = proov_api_data["bet_data"].get("game_name", "MadameFortune")
+    context["game_name"] = game_name
+    return context
+
+
+def build_report_contexts(url_pairs: List[Any], max_workers: int = 8) -> List[Dict[str, Any]]:
+    """Fetch report contexts for many (tx_url, proov_url) pairs concurrently.
+
+    build_report_context is pure I/O fan-out, so a bulk run over N bets is
+    network-bound and parallelises cleanly across a thread pool; the pooled
+    session (and HTTP/2 client, when httpx is available) already multiplexes
+    the underlying connections. Results come back in input order.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        futures = [ex.submit(build_report_context, tx_url, proov_url)
+                   for tx_url, proov_url in url_pairs]
+        return [f.result() for f in futures]
+
+
 def main() -> None:
+    global _cache_enabled
     args = parse_args()
+    _cache_enabled = args.cache
     ensure_dir(args.output)
     styles = create_custom_styles()
+    # One timestamp for the whole document; anything dated in the story
+    # should reference this rather than re-reading the clock.
+    now_str = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
 
-    signature = extract_signature_from_solscan_url(args.tx_url)
+    print("Fetching comprehensive data for ultimate analysis...")
+    context = build_report_context(args.tx_url, args.proov_url)
+    signature = context["signature"]
     if not signature:
         print("Could not extract transaction signature from URL:", args.tx_url, file=sys.stderr)
         sys.exit(1)
 
-    print("Fetching comprehensive data for ultimate analysis...")
-    
-    # Get all data
-    tx, err = fetch_transaction(signature)
-    
-    address = None
-    nonce = None
-    if "balance_address=" in args.proov_url and "nonce=" in args.proov_url:
-        try:
-            from urllib.parse import urlparse, parse_qs
-            q = parse_qs(urlparse(args.proov_url).query)
-            address = q.get("balance_address", [None])[0]
-            nonce_str = q.get("nonce", [None])[0]
-            nonce = int(nonce_str) if nonce_str else None
-        except Exception:
-            pass
-    
-    proov_api_data = {}
-    if address and nonce:
-        proov_api_data = fetch_proov_api_data(address, nonce)
+    tx = context["tx"]
+    err = context["tx_error"]
+    proov_api_data = context["proov_api_data"]
 
     print("Generating ultimate comprehensive analysis...")
-    
+
+    # Build into memory and write once: no per-page flush syscalls, no
+    # half-written file left behind if layout raises.
+    buf = io.BytesIO()
     doc = SimpleDocTemplate(
-        args.output,
+        buf,
         pagesize=LETTER,
         leftMargin=0.6 * inch,
         rightMargin=0.6 * inch,
         topMargin=0.6 * inch,
         bottomMargin=0.6 * inch,
+        # invariant fixes the PDF's creation metadata and document ID and
+        # skips that timestamp/ID work (the footer still embeds wall-clock
+        # time, so runs are not byte-identical); compression is CPU on the
+        # synchronous path, so --no-compress trades file size for faster
+        # iteration.
+        pageCompression=int(args.compress),
+        invariant=1,
     )
     
     story = []
@@ -583,10 +889,8 @@ def main() -> None:
     story.append(PageBreak())
     
     # Algorithm Analysis
-    game_name = "MadameFortune"
-    if proov_api_data.get("bet_data"):
-        game_name = proov_api_data["bet_data"].get("game_name", "MadameFortune")
-    
+    game_name = context["game_name"]
+
     story.append(Paragraph("PART III: ALGORITHM & VERIFICATION ANALYSIS", styles['SectionHeader']))
     story.append(create_algorithm_flow_diagram(game_name))
     story.append(Spacer(1, 0.3 * inch))
@@ -672,61 +976,38 @@ def verify_vrf(public_key: bytes, message: bytes, proof: bytes) -> tuple[bool, b
     story.append(Paragraph("PART VI: CONCLUSIONS & RECOMMENDATIONS", styles['SectionHeader']))
     
     story.append(Paragraph("For Players:", styles['SubSection']))
-    player_recs = [
-        "<b>Understand the Risks:</b> This platform has higher risks than licensed casinos due to centralized control.",
-        "<b>No Regulatory Protection:</b> You have no gambling commission to appeal to if issues arise.",
-        "<b>Hidden Odds:</b> You're gambling without knowing your true chances of winning.",
-        "<b>Trust Requirements:</b> You must trust that the company won't manipulate outcomes.",
-    ]
-    
-    for rec in player_recs:
-        story.append(Paragraph(rec, styles['CustomBody']))
-        story.append(Spacer(1, 0.1 * inch))
-    
+    story.append(Paragraph(_PLAYER_RECS_HTML, styles['CustomBody']))
+
     story.append(Paragraph("For Journalists & Investigators:", styles['SubSection']))
-    journalist_recs = [
-        "<b>Focus on Centralization:</b> The key issue is oracle control, not cryptographic validity.",
-        "<b>Compare to Standards:</b> Contrast with truly decentralized systems like Chainlink VRF.",
-        "<b>Investigate Patterns:</b> Look for suspicious win patterns from specific wallets.",
-        "<b>Regulatory Gaps:</b> Highlight the lack of oversight in crypto gambling.",
-    ]
-    
-    for rec in journalist_recs:
-        story.append(Paragraph(rec, styles['CustomBody']))
-        story.append(Spacer(1, 0.1 * inch))
-    
+    story.append(Paragraph(_JOURNALIST_RECS_HTML, styles['CustomBody']))
+
     story.append(Paragraph("For the Platform (Proov Network):", styles['SubSection']))
-    platform_recs = [
-        "<b>Decentralize Oracles:</b> Use independent third-party oracle providers.",
-        "<b>Publish Odds:</b> Disclose win probabilities for all games.",
-        "<b>Independent Audit:</b> Have RNG and fairness audited by external firms.",
-        "<b>Transparency Reports:</b> Publish regular fairness and operation reports.",
-    ]
-    
-    for rec in platform_recs:
-        story.append(Paragraph(rec, styles['CustomBody']))
-        story.append(Spacer(1, 0.1 * inch))
-    
-    # Final summary box
-    story.append(Spacer(1, 0.3 * inch))
-    story.append(Paragraph(
-        "BOTTOM LINE: While Proov Network uses advanced cryptography, the centralized trust model "
-        "creates risks that players should understand. The platform would benefit from true "
-        "decentralization and regulatory oversight to protect players.",
-        styles['HighlightBox']
-    ))
-    
-    # Technical details footer
-    story.append(Spacer(1, 0.2 * inch))
-    story.append(Paragraph(
-        f"Complete Analysis Report | Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} | "
-        f"Transaction: {signature} | Analysis covers: Player Journey, Risk Assessment, "
-        f"Algorithm Analysis, Verification Process, and Recommendations",
-        ParagraphStyle(name="TechFooter", fontSize=8, textColor=COLORS['secondary'])
-    ))
+    story.append(Paragraph(_PLATFORM_RECS_HTML, styles['CustomBody']))
+    
+    # Final summary box + technical footer as one block: the frame
+    # algorithm measures it in a single pass and never splits it across
+    # a page boundary.
+    story.append(KeepTogether([
+        Spacer(1, 0.3 * inch),
+        Paragraph(
+            "BOTTOM LINE: While Proov Network uses advanced cryptography, the centralized trust model "
+            "creates risks that players should understand. The platform would benefit from true "
+            "decentralization and regulatory oversight to protect players.",
+            styles['HighlightBox']
+        ),
+        Spacer(1, 0.2 * inch),
+        Paragraph(
+            f"Complete Analysis Report | Generated: {now_str} | "
+            f"Transaction: {signature} | Analysis covers: Player Journey, Risk Assessment, "
+            f"Algorithm Analysis, Verification Process, and Recommendations",
+            TECH_FOOTER_STYLE
+        ),
+    ]))
     
     # Build the ultimate PDF
     doc.build(story)
+    with open(args.output, "wb") as f:
+        f.write(buf.getbuffer())
     print(f"Ultimate comprehensive analysis generated at: {args.output}")
 
 